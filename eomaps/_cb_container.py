@@ -4,16 +4,155 @@ from eomaps.callbacks import (
     keypress_callbacks,
     move_callbacks,
 )
-from types import SimpleNamespace
-
 from functools import update_wrapper, partial, wraps
 from collections import defaultdict
+import queue
+import threading
+import traceback
 import matplotlib.pyplot as plt
 
-from pyproj import Transformer
-
 import numpy as np
 
+from .helpers import _get_transformer
+
+
+# default matplotlib keymaps that are removed to avoid interaction with
+# keypress callbacks
+_DEFAULT_KEYMAPS_TO_REMOVE = {
+    "keymap.back": ("c", "left"),
+    "keymap.forward": ("v", "right"),
+    "keymap.grid": ("g",),
+    "keymap.grid_minor": ("G",),
+    "keymap.home": ("h", "r"),
+    "keymap.pan": ("p",),
+    "keymap.quit": ("q",),
+    "keymap.save": ("s",),
+    "keymap.xscale": ("k", "L"),
+    "keymap.yscale": ("l",),
+}
+
+
+class _fwd_mouseevent:
+    """a lightweight MouseEvent used to forward events to other Maps-objects"""
+
+    __slots__ = ("inaxes", "dblclick", "button", "xdata", "ydata", "key")
+
+    def __init__(self, inaxes, dblclick, button, xdata, ydata, key):
+        self.inaxes = inaxes
+        self.dblclick = dblclick
+        self.button = button
+        self.xdata = xdata
+        self.ydata = ydata
+        self.key = key
+
+
+class _fwd_pickevent:
+    """a lightweight PickEvent used to forward events to other Maps-objects"""
+
+    # ID, ind, val and dist are assigned based on the result of the picker
+    __slots__ = (
+        "artist",
+        "dblclick",
+        "button",
+        "mouseevent",
+        "ID",
+        "ind",
+        "val",
+        "dist",
+    )
+
+    def __init__(self, artist, dblclick, button, mouseevent):
+        self.artist = artist
+        self.dblclick = dblclick
+        self.button = button
+        self.mouseevent = mouseevent
+
+
+class _threaded_callback:
+    """
+    A wrapper to execute a callback in a separate (daemon) thread.
+
+    Events are put in a queue that holds only 1 item. If the callback takes
+    longer than the time between 2 events, outdated events are dropped so that
+    the callback is always executed with the most recent event.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._queue = None
+        self._thread = None
+
+    def _run(self, q):
+        # each thread uses its own queue so that a stopped thread can't receive
+        # events intended for a re-started thread
+        while True:
+            kwargs = q.get()
+            if kwargs is None:
+                break
+            try:
+                self._callback(**kwargs)
+            except ReferenceError:
+                # ignore errors caused by no-longer existing weakrefs
+                pass
+            except Exception:
+                print("EOmaps: there was an error in a threaded callback:")
+                traceback.print_exc()
+
+    def _put(self, item):
+        # only the main thread puts items in the queue, so there is always
+        # a free slot after removing the outdated item
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put_nowait(item)
+
+    def __call__(self, **kwargs):
+        if self._thread is None:
+            self._queue = queue.Queue(maxsize=1)
+            self._thread = threading.Thread(
+                target=self._run, args=(self._queue,), daemon=True
+            )
+            self._thread.start()
+
+        self._put(kwargs)
+
+    def _stop(self):
+        # stop the thread (pending events are dropped)
+        if self._thread is not None:
+            self._put(None)
+            self._thread = None
+
+
+class _attach_container(object):
+    """
+    base-class for the "attach" accessors of the callback containers
+
+    The accessors for the pre-defined callbacks are created on first access
+    (and cached) to avoid creating all wrappers whenever a container is
+    initialized.
+    """
+
+    def __init__(self, parent):
+        self._parent = parent
+
+    def __getattr__(self, name):
+        # only called if the attribute does not exist (yet)
+        if name.startswith("_") or name not in self._parent._cb_list:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        f = update_wrapper(
+            partial(self._parent._add_callback, callback=name),
+            getattr(self._parent._cb, name),
+        )
+        setattr(self, name, f)
+        return f
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()).union(self._parent._cb_list))
+
 
 class _cb_container(object):
     """base-class for callback containers"""
@@ -33,14 +172,45 @@ class _cb_container(object):
         self.get = self._get(self)
 
         self._fwd_cbs = dict()
+        # transformers from the plot-crs of this map to the plot-crs of the
+        # forwarded maps (evaluated once when the events are forwarded)
+        self._fwd_transformers = dict()
+        # the callback-containers of the forwarded maps
+        self._fwd_objs = dict()
 
         self._method = method
         self._event = None
 
+        # a dict to identify the callback-containers associated with an axes
+        # (lazily evaluated, see `_get_axes_objs()`)
+        self._axes_objs = None
+
     def _getobj(self, m):
         """get the equivalent callback container on another maps object"""
         return getattr(m.cb, self._method, None)
 
+    def _reset_axes_objs(self):
+        """reset the cached callback-containers associated with the axes"""
+        self._axes_objs = None
+
+    def _get_axes_objs(self):
+        """
+        get a dict of the callback-containers of the parent Maps-object and all
+        its children, keyed by the axes they belong to
+
+        (the dict is cached until the children or their axes are changed)
+        """
+        if self._axes_objs is None:
+            axes_objs = dict()
+            for m in [*self._m.parent._children, self._m.parent]:
+                ax = m.figure.ax
+                obj = self._getobj(m)
+                if ax is not None and obj is not None:
+                    axes_objs.setdefault(ax, []).append(obj)
+            self._axes_objs = axes_objs
+
+        return self._axes_objs
+
     @property
     def _objs(self):
         """
@@ -49,36 +219,68 @@ class _cb_container(object):
         """
         # Note: it is possible that more than 1 Maps objects are
         # assigned to the same axis!
-        objs = []
         if self._event is not None:
             if hasattr(self._event, "mouseevent"):
                 event = self._event.mouseevent
             else:
                 event = self._event
 
-            for m in [*self._m.parent._children, self._m.parent]:
-                # don't use "is" in here since Maps-children are proxies
-                # (and so are their attributes)!
-                if event.inaxes == m.figure.ax:
-                    obj = self._getobj(m)
-                    if obj is not None:
-                        objs.append(obj)
-        return objs
+            return self._get_axes_objs().get(event.inaxes, [])
+        return []
+
+    def _add_fwd_cb(self, m):
+        """forward events of this container to the Maps-object "m" """
+        self._fwd_cbs[id(m)] = m
+        if m.crs_plot == self._m.crs_plot:
+            # no transformation required for maps with the same plot-crs
+            self._fwd_transformers[id(m)] = None
+        else:
+            self._fwd_transformers[id(m)] = _get_transformer(
+                self._m.crs_plot, m.crs_plot
+            )
+        self._fwd_objs[id(m)] = self._getobj(m)
+
+    def _get_fwd_obj(self, key, m):
+        """get the (cached) callback-container of a forwarded Maps-object"""
+        obj = self._fwd_objs.get(key, None)
+        if obj is None:
+            # the container might have been created after forwarding the events
+            # (e.g. for custom pickers)
+            obj = self._fwd_objs[key] = self._getobj(m)
+        return obj
+
+    def _get_fwd_coords(self, x, y):
+        """
+        transform a position to the plot-crs of all forwarded Maps-objects
+
+        (the position is only transformed once for each unique plot-crs)
+        """
+        coords, transformed = dict(), dict()
+        for key, m in self._fwd_cbs.items():
+            crs = m.crs_plot
+            if crs not in transformed:
+                transformer = self._fwd_transformers[key]
+                if transformer is None:
+                    transformed[crs] = (x, y)
+                else:
+                    transformed[crs] = transformer.transform(x, y)
+            coords[key] = transformed[crs]
+        return coords
+
+    def _toolbar_active(self):
+        """check if a toolbar-action (e.g. pan or zoom) is active"""
+        toolbar = self._m.figure.f.canvas.toolbar
+        return toolbar is not None and toolbar.mode != ""
+
+    def _ignore_event(self):
+        """check if callback-events should be ignored"""
+        return self._m._ignore_cb_events or self._toolbar_active()
 
     def _clear_temporary_artists(self):
         while len(self._temporary_artists) > 0:
             art = self._temporary_artists.pop(-1)
             self._m.BM._artists_to_clear[self._method].append(art)
 
-    def _sort_cbs(self, cbs):
-        if not cbs:
-            return set()
-        cbnames = set([i.rsplit("__", 1)[0].rsplit("_", 1)[0] for i in cbs])
-        sortp = self._cb_list + list(set(self._cb_list) ^ cbnames)
-        return sorted(
-            list(cbs), key=lambda w: sortp.index(w.rsplit("__", 1)[0].rsplit("_", 1)[0])
-        )
-
     def __repr__(self):
         txt = "Attached callbacks:\n    " + "\n    ".join(
             f"{key}" for key in self.get.attached_callbacks
@@ -97,7 +299,7 @@ class _cb_container(object):
             The Maps-objects that should execute the callback.
         """
         for m in args:
-            self._fwd_cbs[id(m)] = m
+            self._add_fwd_cb(m)
 
     def share_events(self, *args):
         """
@@ -114,7 +316,7 @@ class _cb_container(object):
         for m1 in (self._m, *args):
             for m2 in (self._m, *args):
                 if m1 is not m2:
-                    self._getobj(m1)._fwd_cbs[id(m2)] = m2
+                    self._getobj(m1)._add_fwd_cb(m2)
 
     def add_temporary_artist(self, artist):
         """
@@ -153,7 +355,16 @@ class _click_container(_cb_container):
         # the default button to use when attaching callbacks
         self._default_button = default_button
 
-    class _attach:
+        # counters used to get unique names for the attached callbacks
+        self._cb_counts = defaultdict(int)
+        # the function-name and layer associated with the callback-keys
+        # (to avoid parsing the keys on each event)
+        # {(btn_key, button_modifier, cbkey) : (function-name, layer)}
+        self._cb_names = dict()
+        # the position of the pre-defined callbacks in the execution order
+        self._cb_order = {name: i for i, name in enumerate(self._cb_list)}
+
+    class _attach(_attach_container):
         """
         Attach custom or pre-defined callbacks to the map.
 
@@ -187,6 +398,16 @@ class _click_container(_cb_container):
             - False: Only execute the callback on clicks.
 
             The default is True.
+        threaded : bool
+            Indicator if the callback should be executed in a separate thread.
+
+            - If True, events are only queued and the callback is executed in a
+              background-thread. If the callback is slower than the events, only
+              the most recent event is executed.
+            - NOTE: Matplotlib is NOT thread-safe! Only use this for callbacks that
+              do NOT modify the figure (e.g. loading or processing data).
+
+            The default is False.
 
         For additional keyword-arguments check the doc of the callback-functions!
 
@@ -213,20 +434,6 @@ class _click_container(_cb_container):
 
         """
 
-        def __init__(self, parent):
-            self._parent = parent
-
-            # attach pre-defined callbacks
-            for cb in self._parent._cb_list:
-                setattr(
-                    self,
-                    cb,
-                    update_wrapper(
-                        partial(self._parent._add_callback, callback=cb),
-                        getattr(self._parent._cb, cb),
-                    ),
-                )
-
         def __call__(self, f, double_click=False, button=None, modifier=None, **kwargs):
             """
             add a custom callback-function to the map
@@ -273,6 +480,16 @@ class _click_container(_cb_container):
                 - False: Only execute the callback on clicks.
 
                 The default is True.
+            threaded : bool
+                Indicator if the callback should be executed in a separate thread.
+
+                - If True, events are only queued and the callback is executed in a
+                  background-thread. If the callback is slower than the events, only
+                  the most recent event is executed.
+                - NOTE: Matplotlib is NOT thread-safe! Only use this for callbacks
+                  that do NOT modify the figure (e.g. loading or processing data).
+
+                The default is False.
             kwargs :
                 kwargs passed to the callback-function
                 For documentation of the individual functions check the docs in `m.cb`
@@ -309,7 +526,10 @@ class _click_container(_cb_container):
             self.m = parent._m
             self.cb = parent._cb
 
-            self.cbs = defaultdict(lambda: defaultdict(dict))
+            # use a plain dict to avoid creating new (empty) entries on lookup
+            self.cbs = dict()
+            # the names of all attached callbacks (in the order of attachment)
+            self._attached_cbs = dict()
 
         @property
         def picked_object(self):
@@ -343,13 +563,7 @@ class _click_container(_cb_container):
 
         @property
         def attached_callbacks(self):
-            cbs = []
-            for ds, dsdict in self.cbs.items():
-                for b, bdict in dsdict.items():
-                    for name in bdict.keys():
-                        cbs.append(f"{name}__{ds}__{b}")
-
-            return cbs
+            return list(self._attached_cbs)
 
     def remove(self, callback=None):
         """
@@ -388,15 +602,35 @@ class _click_container(_cb_container):
 
         if bdict is not None:
             if cbname in bdict:
-                del bdict[cbname]
+                cb = bdict.pop(cbname)
+                self.get._attached_cbs.pop(callback, None)
+
+                # stop the thread of threaded callbacks
+                if isinstance(cb, _threaded_callback):
+                    cb._stop()
+
+                # remove empty dicts so that only attached callbacks are stored
+                if not bdict:
+                    del dsdict[bname]
+                    if not dsdict:
+                        del self.get.cbs[ds]
 
                 # call cleanup methods on removal
-                fname = name.rsplit("_", 1)[0]
+                fname = self._cb_names.pop((ds, bname, cbname))[0]
                 if hasattr(self._cb, f"_{fname}_cleanup"):
                     getattr(self._cb, f"_{fname}_cleanup")()
             else:
                 print(f"EOmaps: there is no callback named {callback}")
 
+    def _stop_threaded_callbacks(self):
+        # stop the threads of all threaded callbacks (e.g. if the figure is closed)
+        # (threads are re-started on the next event if the callbacks are re-used)
+        for dsdict in self.get.cbs.values():
+            for bdict in dsdict.values():
+                for cb in bdict.values():
+                    if isinstance(cb, _threaded_callback):
+                        cb._stop()
+
     def set_sticky_modifiers(self, *args):
         """
         Define keys on the keyboard that should be treated as "sticky modifiers".
@@ -431,6 +665,17 @@ class _click_container(_cb_container):
         if self._method == "click":
             self._m.cb._click_move._sticky_modifiers = args
 
+    def _sort_cbs(self, cbs, btn_key, button_modifier):
+        # sort callbacks by the order of the pre-defined callbacks
+        # (custom callbacks are executed last)
+        n = len(self._cb_list)
+        return sorted(
+            cbs,
+            key=lambda w: self._cb_order.get(
+                self._cb_names[(btn_key, button_modifier, w)][0], n
+            ),
+        )
+
     def _add_callback(
         self,
         *args,
@@ -504,6 +749,16 @@ class _click_container(_cb_container):
             - False: Only execute the callback on clicks.
 
             The default is True.
+        threaded : bool
+            Indicator if the callback should be executed in a separate thread.
+
+            - If True, events are only queued and the callback is executed in a
+              background-thread. If the callback is slower than the events, only
+              the most recent event is executed.
+            - NOTE: Matplotlib is NOT thread-safe! Only use this for callbacks that
+              do NOT modify the figure (e.g. loading or processing data).
+
+            The default is False.
         **kwargs :
             kwargs passed to the callback-function
             For documentation of the individual functions check the docs in `m.cb`
@@ -540,6 +795,8 @@ class _click_container(_cb_container):
         elif on_motion is True:
             print("EOmaps: 'on_motion=True' is only possible for 'click' callbacks!")
 
+        threaded = kwargs.pop("threaded", False)
+
         assert not all(
             i in kwargs for i in ["pos", "ID", "val", "double_click", "button"]
         ), 'the names "pos", "ID", "val" cannot be used as keyword-arguments!'
@@ -562,25 +819,35 @@ class _click_container(_cb_container):
         # check for modifiers
         button_modifier = f"{button}__{modifier}"
 
-        d = self.get.cbs[btn_key][button_modifier]
+        d = self.get.cbs.setdefault(btn_key, dict()).setdefault(button_modifier, dict())
 
         # get a unique name for the callback
         # name_idx__layer
-        ncb = [
-            int(i.split("__", 1)[0].rsplit("_", 1)[1])
-            for i in d
-            if i.startswith(callback.__name__)
-        ]
-        cbkey = (
-            callback.__name__
-            + f"_{max(ncb) + 1 if len(ncb) > 0 else 0}"
-            + f"__{self._m.layer}"
+        count_key = (btn_key, button_modifier, callback.__name__)
+        cbkey = f"{callback.__name__}_{self._cb_counts[count_key]}__{self._m.layer}"
+        self._cb_counts[count_key] += 1
+        self._cb_names[(btn_key, button_modifier, cbkey)] = (
+            callback.__name__,
+            str(self._m.layer),
         )
 
-        d[cbkey] = partial(callback, *args, **kwargs)
+        # only wrap the callback if additional arguments are provided
+        # (to avoid the overhead of merging kwargs on every event)
+        if args or kwargs:
+            d[cbkey] = partial(callback, *args, **kwargs)
+        else:
+            d[cbkey] = callback
+
+        if threaded is True:
+            d[cbkey] = _threaded_callback(d[cbkey])
+        # keep the callbacks sorted by their execution order so that they can
+        # be executed without sorting them on each event
+        for key in self._sort_cbs(d, btn_key, button_modifier):
+            d[key] = d.pop(key)
 
         # add mouse-button assignment as suffix to the name (with __ separator)
         cbname = cbkey + f"__{btn_key}__{button}__{modifier}"  # TODO
+        self.get._attached_cbs[cbname] = None
 
         if movecb_name is not None:
             self._connected_move_cbs[cbname] = [movecb_name]
@@ -638,12 +905,12 @@ class cb_click_container(_click_container):
         return clickdict
 
     def _onclick(self, event):
-        clickdict = self._get_clickdict(event)
+        btn_key = "double" if event.dblclick else "single"
+        cbs = self.get.cbs.get(btn_key, None)
 
-        if event.dblclick:
-            cbs = self.get.cbs["double"]
-        else:
-            cbs = self.get.cbs["single"]
+        # don't do anything if no callbacks are attached
+        if not cbs:
+            return
 
         # check for keypress-modifiers
         if (
@@ -657,20 +924,25 @@ class cb_click_container(_click_container):
 
         button_modifier = f"{event.button}__{event_key}"
 
-        if button_modifier in cbs:
-            bcbs = cbs[button_modifier]
+        bcbs = cbs.get(button_modifier, None)
+        if not bcbs:
+            return
 
-            for key in self._sort_cbs(bcbs):
-                layer = key.split("__")[1]
-                if layer != "all" and layer != str(self._m.BM.bg_layer):
-                    return
+        clickdict = self._get_clickdict(event)
 
-                cb = bcbs[key]
-                if clickdict is not None:
-                    cb(**clickdict)
+        # callbacks are already sorted by their execution order
+        for key, cb in list(bcbs.items()):
+            layer = self._cb_names[(btn_key, button_modifier, key)][1]
+            if layer != "all" and layer != str(self._m.BM.bg_layer):
+                return
+
+            cb(**clickdict)
 
     def _onrelease(self, event):
-        cbs = self.get.cbs["release"]
+        cbs = self.get.cbs.get("release", None)
+        # don't do anything if no callbacks are attached
+        if not cbs:
+            return
 
         # check for keypress-modifiers
         if (
@@ -703,18 +975,20 @@ class cb_click_container(_click_container):
             self._m.figure.f.canvas.mpl_disconnect(self._cid_button_release_event)
         self._cid_button_release_event = None
 
+        self._stop_threaded_callbacks()
+
     def _add_click_callback(self):
+        # bind frequently used attributes to avoid repeated lookups on each event
+        # (all Maps-objects of a figure share the BlitManager of the parent)
+        bm = self._m.BM
+        method = self._method
+
         def clickcb(event):
             try:
                 self._event = event
 
-                # ignore callbacks while dragging axes
-                if self._m._ignore_cb_events:
-                    return
-                # don't execute callbacks if a toolbar-action is active
-                if (
-                    self._m.figure.f.canvas.toolbar is not None
-                ) and self._m.figure.f.canvas.toolbar.mode != "":
+                # ignore callbacks while dragging axes or if a toolbar-action is active
+                if self._ignore_event():
                     return
 
                 # execute onclick on the maps object that belongs to the clicked axis
@@ -724,29 +998,24 @@ class cb_click_container(_click_container):
                     # clear temporary artists before executing new callbacks to avoid
                     # having old artists around when callbacks are triggered again
                     obj._clear_temporary_artists()
-                    self._m.BM._clear_temp_artists(self._method)
+                    bm._clear_temp_artists(method)
                     obj._onclick(event)
 
                     # forward callbacks to the connected maps-objects
                     obj._fwd_cb(event)
 
-                self._m.parent.BM.update(clear=self._method)
+                bm.update(clear=method)
             except ReferenceError:
                 pass
 
         def releasecb(event):
             try:
-                # ignore callbacks while dragging axes
-                if self._m._ignore_cb_events:
-                    return
-                # don't execute callbacks if a toolbar-action is active
-                if (
-                    self._m.figure.f.canvas.toolbar is not None
-                ) and self._m.figure.f.canvas.toolbar.mode != "":
+                # ignore callbacks while dragging axes or if a toolbar-action is active
+                if self._ignore_event():
                     return
 
                 # clear temporary click artists when the mouse-button is released
-                self._m.BM._clear_temp_artists(self._method)
+                bm._clear_temp_artists(method)
 
                 # execute onclick on the maps object that belongs to the clicked axis
                 # and forward the event to all forwarded maps-objects
@@ -782,35 +1051,29 @@ class cb_click_container(_click_container):
 
         if event.name == "button_release_event":
             for key, m in self._fwd_cbs.items():
-                obj = self._getobj(m)
+                obj = self._get_fwd_obj(key, m)
                 if obj is None:
                     continue
                 obj._onrelease(event)
 
         else:
+            # transform the coordinates of the clicked location
+            coords = self._get_fwd_coords(event.xdata, event.ydata)
+
             for key, m in self._fwd_cbs.items():
-                obj = self._getobj(m)
+                obj = self._get_fwd_obj(key, m)
                 if obj is None:
                     continue
 
-                transformer = Transformer.from_crs(
-                    self._m.crs_plot,
-                    m.crs_plot,
-                    always_xy=True,
-                )
-
-                # transform the coordinates of the clicked location
-                xdata, ydata = transformer.transform(event.xdata, event.ydata)
+                xdata, ydata = coords[key]
 
-                dummymouseevent = SimpleNamespace(
+                dummymouseevent = _fwd_mouseevent(
                     inaxes=m.figure.ax,
                     dblclick=event.dblclick,
                     button=event.button,
                     xdata=xdata,
                     ydata=ydata,
-                    key=event.key
-                    # x=event.mouseevent.x,
-                    # y=event.mouseevent.y,
+                    key=event.key,
                 )
 
                 obj._onclick(dummymouseevent)
@@ -860,7 +1123,14 @@ class cb_move_container(cb_click_container):
             self._m.figure.f.canvas.mpl_disconnect(self._cid_motion_event)
         self._cid_motion_event = None
 
+        self._stop_threaded_callbacks()
+
     def _add_move_callback(self):
+        # bind frequently used attributes to avoid repeated lookups on each event
+        # (all Maps-objects of a figure share the BlitManager of the parent)
+        bm = self._m.BM
+        method = self._method
+
         def movecb(event):
             try:
                 self._event = event
@@ -869,27 +1139,22 @@ class cb_move_container(cb_click_container):
                 if self._button_down:
                     if not event.button:  # or (event.inaxes != self._m.figure.ax):
                         # always clear temporary move-artists
-                        if self._method == "move":
+                        if method == "move":
                             for obj in self._objs:
                                 obj._clear_temporary_artists()
-                            self._m.BM._clear_temp_artists(self._method)
+                            bm._clear_temp_artists(method)
                         return
                 else:
                     if event.button:  # or (event.inaxes != self._m.figure.ax):
                         # always clear temporary move-artists
-                        if self._method == "move":
+                        if method == "move":
                             for obj in self._objs:
                                 obj._clear_temporary_artists()
-                            self._m.BM._clear_temp_artists(self._method)
+                            bm._clear_temp_artists(method)
                         return
 
-                # ignore callbacks while dragging axes
-                if self._m._ignore_cb_events:
-                    return
-                # don't execute callbacks if a toolbar-action is active
-                if (
-                    self._m.figure.f.canvas.toolbar is not None
-                ) and self._m.figure.f.canvas.toolbar.mode != "":
+                # ignore callbacks while dragging axes or if a toolbar-action is active
+                if self._ignore_event():
                     return
 
                 # execute onclick on the maps object that belongs to the clicked axis
@@ -898,13 +1163,13 @@ class cb_move_container(cb_click_container):
                     # clear temporary artists before executing new callbacks to avoid
                     # having old artists around when callbacks are triggered again
                     obj._clear_temporary_artists()
-                    self._m.BM._clear_temp_artists(self._method)
+                    bm._clear_temp_artists(method)
                     obj._onclick(event)
 
                     # forward callbacks to the connected maps-objects
                     obj._fwd_cb(event)
 
-                self._m.parent.BM.update(clear=self._method)
+                bm.update(clear=method)
             except ReferenceError:
                 pass
 
@@ -1023,13 +1288,13 @@ class cb_pick_container(_click_container):
         ind = event.ind
         if ind is not None:
             if self._m.figure.coll is not None and event.artist is self._m.figure.coll:
+                # don't cache the arrays since _props can be updated
+                # (e.g. re-plotting or memory-mapping the data)
+                props = self._m._props
                 clickdict = dict(
-                    pos=(
-                        self._m._props["x0"].flat[ind],
-                        self._m._props["y0"].flat[ind],
-                    ),
-                    ID=self._m._props["ids"].flat[ind],
-                    val=self._m._props["z_data"][ind],
+                    pos=(props["x0"].flat[ind], props["y0"].flat[ind]),
+                    ID=props["ids"].flat[ind],
+                    val=props["z_data"][ind],
                     ind=ind,
                     picker_name=self._picker_name,
                 )
@@ -1055,17 +1320,15 @@ class cb_pick_container(_click_container):
             return
 
         # don't execute callbacks if a toolbar-action is active
-        if (
-            self._m.figure.f.canvas.toolbar is not None
-        ) and self._m.figure.f.canvas.toolbar.mode != "":
+        if self._toolbar_active():
             return
 
-        clickdict = self._get_pickdict(event)
+        btn_key = "double" if event.mouseevent.dblclick else "single"
+        cbs = self.get.cbs.get(btn_key, None)
 
-        if event.mouseevent.dblclick:
-            cbs = self.get.cbs["double"]
-        else:
-            cbs = self.get.cbs["single"]
+        # don't do anything if no callbacks are attached
+        if not cbs:
+            return
 
         # check for keypress-modifiers
         if (
@@ -1079,44 +1342,51 @@ class cb_pick_container(_click_container):
 
         button_modifier = f"{event.mouseevent.button}__{event_key}"
 
-        if button_modifier in cbs:
-            bcbs = cbs[button_modifier]
+        bcbs = cbs.get(button_modifier, None)
+        if not bcbs:
+            return
 
-            for key in self._sort_cbs(bcbs):
-                layer = key.split("__")[1]
-                if layer != "all" and layer != str(self._m.BM.bg_layer):
-                    # TODO
-                    # only execute callbacks if the layer name of the associated
-                    # maps-object is active
-                    return
+        clickdict = self._get_pickdict(event)
+        # nothing to do if no datapoint has been picked
+        if clickdict is None:
+            return
+
+        # callbacks are already sorted by their execution order
+        for key, cb in list(bcbs.items()):
+            layer = self._cb_names[(btn_key, button_modifier, key)][1]
+            if layer != "all" and layer != str(self._m.BM.bg_layer):
+                # TODO
+                # only execute callbacks if the layer name of the associated
+                # maps-object is active
+                return
 
-                cb = bcbs[key]
-                if clickdict is not None:
-                    cb(**clickdict)
+            cb(**clickdict)
 
     def _reset_cids(self):
         for method, cid in self._cid_pick_event.items():
             self._m.figure.f.canvas.mpl_disconnect(cid)
         self._cid_pick_event.clear()
 
+        self._stop_threaded_callbacks()
+
     def _add_pick_callback(self):
         # execute onpick and forward the event to all connected Maps-objects
 
+        # bind frequently used attributes to avoid repeated lookups on each event
+        # (all Maps-objects of a figure share the BlitManager of the parent)
+        bm = self._m.BM
+        method = self._method
+        after_update_append = bm._after_update_actions.append
+
         def pickcb(event):
             try:
 
                 # make sure pickcb is only executed if we are on the right layer
-                if self._m.layer != "all" and self._m.layer != self._m.BM.bg_layer:
+                if self._m.layer != "all" and self._m.layer != bm.bg_layer:
                     return
 
-                # check if we want to ignore callbacks
-                if self._m._ignore_cb_events:
-                    return
-
-                # don't execute callbacks if a toolbar-action is active
-                if (
-                    self._m.figure.f.canvas.toolbar is not None
-                ) and self._m.figure.f.canvas.toolbar.mode != "":
+                # ignore callbacks while dragging axes or if a toolbar-action is active
+                if self._ignore_event():
                     return
 
                 if not self._artist is event.artist:
@@ -1124,12 +1394,12 @@ class cb_pick_container(_click_container):
 
                 # make sure temporary artists are cleared before executing new callbacks
                 # to avoid having old artists around when callbacks are triggered again
-                self._m.BM._clear_temp_artists(self._method)
+                bm._clear_temp_artists(method)
 
                 self._event = event
                 # check if the artists has a custom picker assigned
 
-                self._m.BM._clear_temp_artists(self._method)
+                bm._clear_temp_artists(method)
 
                 # execute "_onpick" on the maps-object that belongs to the clicked axes
                 # and forward the event to all forwarded maps-objects
@@ -1137,11 +1407,11 @@ class cb_pick_container(_click_container):
                 # forward callbacks to the connected maps-objects
                 self._fwd_cb(event, self._picker_name)
 
-                self._m.BM._after_update_actions.append(self._clear_temporary_artists)
-                self._m.BM._clear_temp_artists(self._method)
+                after_update_append(self._clear_temporary_artists)
+                bm._clear_temp_artists(method)
 
                 # self._m.parent.BM.update(clear=self._method)
-                self._m.parent.BM._clear_temp_artists(self._method)
+                bm._clear_temp_artists(method)
                 # don't update here... the click-callback will take care of it!
             except ReferenceError:
                 pass
@@ -1157,40 +1427,37 @@ class cb_pick_container(_click_container):
         if event.mouseevent.inaxes != self._m.figure.ax:
             return
 
+        # transform the coordinates of the clicked location to the
+        # crs of the forwarded maps
+        coords = self._get_fwd_coords(event.mouseevent.xdata, event.mouseevent.ydata)
+
         for key, m in self._fwd_cbs.items():
-            obj = self._getobj(m)
+            obj = self._get_fwd_obj(key, m)
             if obj is None:
                 continue
 
-            transformer = Transformer.from_crs(
-                self._m.crs_plot,
-                m.crs_plot,
-                always_xy=True,
-            )
+            # avoid evaluating the picker (e.g. querying the search-tree) if
+            # there is nothing to pick or no callback would be executed anyway
+            if obj._artist is None or not obj.get._attached_cbs:
+                continue
+            if obj._m.layer != "all" and obj._m.layer != obj._m.BM.bg_layer:
+                continue
 
-            # transform the coordinates of the clicked location to the
-            # crs of the map
-            xdata, ydata = transformer.transform(
-                event.mouseevent.xdata, event.mouseevent.ydata
-            )
+            xdata, ydata = coords[key]
 
-            dummymouseevent = SimpleNamespace(
+            dummymouseevent = _fwd_mouseevent(
                 inaxes=m.figure.ax,
                 dblclick=event.mouseevent.dblclick,
                 button=event.mouseevent.button,
                 xdata=xdata,
                 ydata=ydata,
                 key=event.mouseevent.key,
-                # x=event.mouseevent.x,
-                # y=event.mouseevent.y,
             )
-            dummyevent = SimpleNamespace(
+            dummyevent = _fwd_pickevent(
                 artist=obj._artist,
                 dblclick=event.mouseevent.dblclick,
                 button=event.mouseevent.button,
-                # inaxes=m.figure.ax,
                 mouseevent=dummymouseevent,
-                # picker_name=picker_name,
             )
 
             pick = obj._picker(obj._artist, dummymouseevent)
@@ -1241,6 +1508,9 @@ class keypress_container(_cb_container):
         # remember last pressed key (for use as "sticky_modifier")
         self._modifier = None
 
+        # counters used to get unique names for the attached callbacks
+        self._cb_counts = defaultdict(int)
+
     def _init_cbs(self):
         if self._m.parent is self._m:
             self._initialize_callbacks()
@@ -1308,7 +1578,7 @@ class keypress_container(_cb_container):
                 "key_press_event", _onpress
             )
 
-    class _attach:
+    class _attach(_attach_container):
         """
         Attach custom or pre-defined callbacks on keypress events.
 
@@ -1327,20 +1597,6 @@ class keypress_container(_cb_container):
 
         """
 
-        def __init__(self, parent):
-            self._parent = parent
-
-            # attach pre-defined callbacks
-            for cb in self._parent._cb_list:
-                setattr(
-                    self,
-                    cb,
-                    update_wrapper(
-                        partial(self._parent._add_callback, callback=cb),
-                        getattr(self._parent._cb, cb),
-                    ),
-                )
-
         def __call__(self, f, key, **kwargs):
             """
             add a custom callback-function to the map
@@ -1383,7 +1639,8 @@ class keypress_container(_cb_container):
             self.m = parent._m
             self.cb = parent._cb
 
-            self.cbs = defaultdict(dict)
+            # use a plain dict to avoid creating new (empty) entries on lookup
+            self.cbs = dict()
 
         @property
         def attached_callbacks(self):
@@ -1416,6 +1673,10 @@ class keypress_container(_cb_container):
             if cbname in cbs:
                 del cbs[cbname]
 
+                # remove empty dicts so that only attached callbacks are stored
+                if not cbs:
+                    del self.get.cbs[key]
+
                 # call cleanup methods on removal
                 fname = name.rsplit("_", 1)[0]
                 if hasattr(self._cb, f"_{fname}_cleanup"):
@@ -1466,19 +1727,15 @@ class keypress_container(_cb_container):
             )
             callback = getattr(self._cb, callback)
 
-        cbdict = self.get.cbs[key]
+        cbdict = self.get.cbs.setdefault(key, dict())
         # get a unique name for the callback
-        ncb = [
-            int(i.rsplit("_", 1)[1]) for i in cbdict if i.startswith(callback.__name__)
-        ]
-        cbkey = (
-            callback.__name__
-            + f"_{max(ncb) + 1 if len(ncb) > 0 else 0}"
-            + f"__{self._m.layer}"
-        )
+        count_key = (key, callback.__name__)
+        cbkey = f"{callback.__name__}_{self._cb_counts[count_key]}__{self._m.layer}"
+        self._cb_counts[count_key] += 1
 
         # append the callback
-        cbdict[cbkey] = partial(callback, **kwargs)
+        # (only wrap the callback if additional arguments are provided)
+        cbdict[cbkey] = partial(callback, **kwargs) if kwargs else callback
 
         return cbkey + f"__{key}"
 
@@ -1641,24 +1898,19 @@ class cb_container:
             obj = getattr(self, method)
             obj._reset_cids()
 
+    def _reset_axes_objs(self):
+        # reset the cached axes -> callback-container mapping
+        # (required if Maps-objects or axes are added or removed)
+        for method in self._methods:
+            obj = getattr(self, method)
+            obj._reset_axes_objs()
+
     @staticmethod
     def _remove_default_keymaps():
         # unattach default keymaps to avoid interaction with keypress events
-        assignments = dict()
-        assignments["keymap.back"] = ["c", "left"]
-        assignments["keymap.forward"] = ["v", "right"]
-        assignments["keymap.grid"] = ["g"]
-        assignments["keymap.grid_minor"] = ["G"]
-        assignments["keymap.home"] = ["h", "r"]
-        assignments["keymap.pan"] = ["p"]
-        assignments["keymap.quit"] = ["q"]
-        assignments["keymap.save"] = ["s"]
-        assignments["keymap.xscale"] = ["k", "L"]
-        assignments["keymap.yscale"] = ["l"]
-
-        for key, val in assignments.items():
-            for v in val:
-                try:
-                    plt.rcParams[key].remove(v)
-                except Exception:
-                    pass
+        for key, val in _DEFAULT_KEYMAPS_TO_REMOVE.items():
+            keys = plt.rcParams[key]
+            filtered = [k for k in keys if k not in val]
+            # only update the rcParams if a keymap is actually removed
+            if len(filtered) < len(keys):
+                plt.rcParams[key] = filtered
@@ -1,40 +1,64 @@
 from functools import lru_cache, partial
+from importlib.util import find_spec
+import math
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from warnings import warn, filterwarnings, catch_warnings
-from types import SimpleNamespace
 from collections import defaultdict
 
 from PIL import Image
 from io import BytesIO
-from pprint import PrettyPrinter
+from pprint import pformat
 
 from cartopy.io.img_tiles import GoogleWTS
 from cartopy import crs as ccrs
 import numpy as np
 
-from pyproj import CRS, Transformer
-
-try:
-    from owslib.wmts import WebMapTileService
-    from owslib.wms import WebMapService
-    import requests
-    from urllib3.exceptions import InsecureRequestWarning
+from pyproj import CRS
 
+# owslib and requests are only imported if WebMap services are actually used
+# (to avoid slowing down the import of EOmaps)
+if find_spec("owslib") is not None and find_spec("requests") is not None:
     _import_OK = True
-
-except ImportError:
+else:
     warn("EOmaps: adding WebMap services requires 'owslib'")
     _import_OK = False
 
-from .helpers import _sanitize
+from .helpers import _sanitize, _get_transformer
 
-from cartopy.io import ogc_clients
 from cartopy.io import RasterSource
-from cartopy.io.ogc_clients import _target_extents
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    # a shared session to re-use connections for subsequent requests to the
+    # same hosts (e.g. REST-API folders, tiles etc.)
+    global _session
+    if _session is None:
+        # the first call usually happens in the threads that fetch the tiles
+        # (use a lock to make sure only one session is created)
+        with _session_lock:
+            if _session is None:
+                import requests
+
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=32, pool_maxsize=32
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+
+    return _session
 
 
 class _WebMap_layer:
     # base class for adding methods to the _wms_layer- and wmts_layer objects
     def __init__(self, m, wms, name):
+        from cartopy.io import ogc_clients
+
         self._m = m
         self.name = name
         self._wms = wms
@@ -61,15 +85,17 @@ class _WebMap_layer:
         pretty-print the available properties of the wms_layer to the console
         """
 
-        txt = ""
+        txt = []
         for key, val in self.wms_layer.__dict__.items():
             if not val:
                 continue
-            p = PrettyPrinter(depth=1, indent=len(key) + 4, width=60 - len(key))
-            s = p.pformat(val).split("\n")
-            s = "\n".join([s[0].replace(" " * (len(key) + 3), ""), *s[1:]])
+            s = pformat(val, depth=1, indent=len(key) + 4, width=60 - len(key))
+            # remove the indentation of the first line
+            first, sep, rest = s.partition("\n")
+            s = first.replace(" " * (len(key) + 3), "") + sep + rest
 
-            txt += f"{key} : {s}\n"
+            txt.append(f"{key} : {s}\n")
+        txt = "".join(txt)
 
         try:
 
@@ -83,12 +109,27 @@ class _WebMap_layer:
         print(f"\n LEGEND available: {legQ}\n\n" + txt)
 
     def fetch_legend(self, style=None):
+        """
+        Fetch the legend of the WebMap layer (if available)
+
+        Parameters
+        ----------
+        style : str, optional
+            The style to use. If None, the currently used style is used.
+            The default is None.
+
+        Returns
+        -------
+        img : np.ndarray or None
+            The RGB or RGBA image-data of the legend
+            (or None if the legend could not be fetched).
+        """
         if style is None:
             style = self._style
         try:
 
             url = self.wms_layer.styles[style]["legend"]
-            legend = requests.get(url)
+            legend = _get_session().get(url)
 
             if url.endswith(".svg"):
                 try:
@@ -101,7 +142,11 @@ class _WebMap_layer:
             else:
                 img = legend.content
 
-            img = Image.open(BytesIO(img))
+            # decode the image into an array once (and release the PIL image)
+            with Image.open(BytesIO(img)) as legend_img:
+                if legend_img.mode not in ("RGB", "RGBA"):
+                    legend_img = legend_img.convert("RGBA")
+                img = np.asarray(legend_img)
         except Exception:
             warn("EOmaps: could not fetch the legend")
             img = None
@@ -174,17 +219,17 @@ class _WebMap_layer:
                 bbox = bbox.transformed(self._m.figure.f.transFigure.inverted())
                 legax.set_position(bbox)
 
+            # the ids of the callbacks that are only connected while the legend
+            # is picked (to avoid executing them on every mouse-motion)
+            cids = []
+
             def cb_release(event):
                 self._legend_picked = False
                 legax.set_frame_on(False)
 
-            def cb_pick(event):
-                if event.inaxes == legax:
-                    legax.set_frame_on(True)
-                    self._legend_picked = True
-                else:
-                    legax.set_frame_on(False)
-                    self._legend_picked = False
+                canvas = self._m.figure.f.canvas
+                while cids:
+                    canvas.mpl_disconnect(cids.pop())
 
             def cb_scroll(event):
                 if not self._legend_picked:
@@ -204,10 +249,25 @@ class _WebMap_layer:
 
                 self._m.BM.update()
 
-            self._m.figure.f.canvas.mpl_connect("scroll_event", cb_scroll)
+            def cb_pick(event):
+                if event.inaxes == legax:
+                    legax.set_frame_on(True)
+                    self._legend_picked = True
+
+                    if not cids:
+                        canvas = self._m.figure.f.canvas
+                        cids.extend(
+                            (
+                                canvas.mpl_connect("scroll_event", cb_scroll),
+                                canvas.mpl_connect("button_release_event", cb_release),
+                                canvas.mpl_connect("motion_notify_event", cb_move),
+                            )
+                        )
+                else:
+                    legax.set_frame_on(False)
+                    self._legend_picked = False
+
             self._m.figure.f.canvas.mpl_connect("button_press_event", cb_pick)
-            self._m.figure.f.canvas.mpl_connect("button_release_event", cb_release)
-            self._m.figure.f.canvas.mpl_connect("motion_notify_event", cb_move)
 
             if not hasattr(self, "_layer"):
                 # use the currently active layer if the webmap service has not yet
@@ -276,11 +336,7 @@ class _WebMap_layer:
             y0 += dy * shrink
             y1 -= dy * shrink
 
-        transformer = Transformer.from_crs(
-            incrs,
-            self._m.crs_plot,
-            always_xy=True,
-        )
+        transformer = _get_transformer(incrs, self._m.crs_plot)
 
         (x0, x1), (y0, y1) = transformer.transform((x0, x1), (y0, y1))
 
@@ -304,10 +360,6 @@ class _WebMap_layer:
 
 
 class _wmts_layer(_WebMap_layer):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        pass
-
     def __call__(self, layer=None, zorder=0, alpha=1, **kwargs):
         """
         Add the WMTS layer to the map
@@ -410,10 +462,6 @@ class _wmts_layer(_WebMap_layer):
 
 
 class _wms_layer(_WebMap_layer):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        pass
-
     def __call__(self, layer=None, zorder=0, alpha=1, **kwargs):
         """
         Add the WMS layer to the map
@@ -511,6 +559,30 @@ class _wms_layer(_WebMap_layer):
         m.BM.add_bg_artist(art, l)
 
 
+class _layer_namespace:
+    # a namespace that initializes the WebMap layer-objects on first access
+    # (services can provide a lot of layers and usually only a few are used)
+    def __init__(self, m, wms, layer_cls, layers):
+        self._m = m
+        self._wms = wms
+        self._layer_cls = layer_cls
+        # a dict of {sanitized name : layer name}
+        self._layers = layers
+
+    def __getattr__(self, name):
+        # only called if the layer-object has not yet been initialized
+        layers = self.__dict__.get("_layers", dict())
+        if name not in layers:
+            raise AttributeError(f"EOmaps: There is no WebMap layer named '{name}'")
+
+        layer = self._layer_cls(self._m, self._wms, layers[name])
+        setattr(self, name, layer)
+        return layer
+
+    def __dir__(self):
+        return list(self._layers)
+
+
 class _WebServiec_collection(object):
     def __init__(self, m, service_type="wmts", url=None):
         self._m = m
@@ -518,8 +590,15 @@ class _WebServiec_collection(object):
         if url is not None:
             self._url = url
 
+        # cached layers (the capabilities are fetched on first access)
+        self._add_layer = None
+        self._layer_names = None
+
     def __getitem__(self, key):
-        return self.add_layer.__dict__[key]
+        add_layer = self.add_layer
+        if key not in add_layer._layers:
+            raise KeyError(key)
+        return getattr(add_layer, key)
 
     def __repr__(self):
         if hasattr(self, "info"):
@@ -528,12 +607,13 @@ class _WebServiec_collection(object):
             return object.__repr__(self)
 
     @property
-    @lru_cache()
     def layers(self):
         """
         get a list of all available layers
         """
-        return list(self.add_layer.__dict__)
+        if self._layer_names is None:
+            self._layer_names = list(self.add_layer._layers)
+        return self._layer_names
 
     def findlayer(self, name):
         """
@@ -553,32 +633,44 @@ class _WebServiec_collection(object):
         """
         return [i for i in self.layers if name.lower() in i.lower()]
 
+    # the capabilities of services are cached (by url) to avoid re-fetching
+    # them for each new Maps-object that uses the same service
+
     @staticmethod
+    @lru_cache()
     def _get_wmts(url):
+        from owslib.wmts import WebMapTileService
+
         # TODO expose useragent
         return WebMapTileService(url)
 
     @staticmethod
+    @lru_cache()
     def _get_wms(url):
+        from owslib.wms import WebMapService
+
         # TODO expose useragent
         return WebMapService(url)
 
+    def _get_service_funcs(self):
+        # get the function to fetch the service and the class used for the layers
+        if self._service_type == "wmts":
+            return self._get_wmts, _wmts_layer
+        else:
+            return self._get_wms, _wms_layer
+
     @property
-    @lru_cache()
     def add_layer(self):
-        if self._service_type == "wmts":
-            wmts = self._get_wmts(self._url)
-            layers = dict()
-            for key in wmts.contents.keys():
-                layers[_sanitize(key)] = _wmts_layer(self._m, wmts, key)
+        if self._add_layer is not None:
+            return self._add_layer
+
+        getter, layer_cls = self._get_service_funcs()
 
-        elif self._service_type == "wms":
-            wms = self._get_wms(self._url)
-            layers = dict()
-            for key in wms.contents.keys():
-                layers[_sanitize(key)] = _wms_layer(self._m, wms, key)
+        wms = getter(self._url)
+        layers = {_sanitize(key): key for key in wms.contents}
 
-        return SimpleNamespace(**layers)
+        self._add_layer = _layer_namespace(self._m, wms, layer_cls, layers)
+        return self._add_layer
 
 
 class REST_API_services:
@@ -681,6 +773,13 @@ class _REST_WMSservice(_WebServiec_collection):
 
         self._layers = None
 
+    @staticmethod
+    def _check_url(url):
+        # only check the status-code (e.g. don't download the content since
+        # the capabilities are fetched again when the service is initialized)
+        with _get_session().get(url, stream=True) as r:
+            return r.status_code == 200
+
     @property
     def _url(self):
         print(self._s_name)
@@ -689,47 +788,47 @@ class _REST_WMSservice(_WebServiec_collection):
         if self._service_type == "wms":
             suffix = "/WMSServer?request=GetCapabilities&service=WMS"
             WMSurl = url.replace("/rest/", "/") + suffix
-            if requests.get(WMSurl).status_code == 200:
+            if self._check_url(WMSurl):
                 url = WMSurl
             else:
                 url = None
         elif self._service_type == "wmts":
             suffix = "/WMTS/1.0.0/WMTSCapabilities.xml"
             WMSurl = url + suffix
-            if requests.get(WMSurl).status_code == 200:
+            if self._check_url(WMSurl):
                 url = WMSurl
             else:
                 url = None
         return url
 
     def _fetch_layers(self):
-        self._layers = dict()
+        # only set the layers once the fetch succeeded
+        # (so that the next access to add_layer retries in case of errors)
+        layers = dict()
         url = self._url
         if url is not None:
-            if self._service_type == "wms":
-                wms = self._get_wms(url)
-                layer_names = list(wms.contents.keys())
-                for lname in layer_names:
-                    self._layers["layer_" + _sanitize(lname)] = _wms_layer(
-                        self._m, wms, lname
-                    )
-            elif self._service_type == "wmts":
-                wmts = self._get_wmts(url)
-                layer_names = list(wmts.contents.keys())
-                for lname in layer_names:
-                    self._layers["layer_" + _sanitize(lname)] = _wmts_layer(
-                        self._m, wmts, lname
-                    )
+            getter, self._layer_cls = self._get_service_funcs()
+
+            self._wms = getter(url)
+            for lname in self._wms.contents:
+                layers["layer_" + _sanitize(lname)] = lname
+
+        self._layers = layers
 
     @property
-    @lru_cache()
     def add_layer(self):
-        self._fetch_layers()
-        if len(self._layers) == 0:
-            print(f"EOmaps: found no {self._service_type} layers for {self._s_name}")
-            return
-        else:
-            return SimpleNamespace(**self._layers)
+        if self._layers is None:
+            self._fetch_layers()
+            if len(self._layers) == 0:
+                print(
+                    f"EOmaps: found no {self._service_type} layers for {self._s_name}"
+                )
+            else:
+                self._add_layer = _layer_namespace(
+                    self._m, self._wms, self._layer_cls, self._layers
+                )
+
+        return self._add_layer
 
 
 class _multi_REST_WMSservice:
@@ -741,7 +840,6 @@ class _multi_REST_WMSservice:
 
         self._fetch_services()
 
-    @lru_cache()
     def _fetch_services(self):
         for (s_name, s_type) in self._services:
             wms_layer = _REST_WMSservice(
@@ -773,7 +871,7 @@ class _REST_API(object):
         _params -- parameters for posting a request
         ret_json -- return the response as JSON.  Default is True.
         """
-        r = requests.post(service, params=_params, verify=False)
+        r = _get_session().post(service, params=_params, verify=False)
 
         # make sure return
         if r.status_code != 200:
@@ -793,6 +891,8 @@ class _REST_API(object):
         service -- full path to a rest service
         """
 
+        from urllib3.exceptions import InsecureRequestWarning
+
         with catch_warnings():
             filterwarnings("ignore", category=InsecureRequestWarning)
 
@@ -801,21 +901,51 @@ class _REST_API(object):
             # parse all services that are not inside a folder
             for s in r["services"]:
                 all_services["SERVICES"].append((s["name"], s["type"]))
-            for s in r["folders"]:
-                new = "/".join([service, s])
-                endpt = self._post(new, _params=self._params)
 
-                for serv in endpt["services"]:
-                    if str(serv["type"]) == "MapServer":
-                        all_services[s].append((serv["name"], serv["type"]))
+            # fetch the contents of all folders in parallel
+            folders = r["folders"]
+            with ThreadPoolExecutor(max_workers=16) as ex:
+                endpts = ex.map(
+                    lambda s: self._post("/".join([service, s]), _params=self._params),
+                    folders,
+                )
+
+                for s, endpt in zip(folders, endpts):
+                    for serv in endpt["services"]:
+                        if str(serv["type"]) == "MapServer":
+                            all_services[s].append((serv["name"], serv["type"]))
         return all_services
 
 
+@lru_cache(maxsize=512)
+def _get_tile_content(url, user_agent):
+    # keep the content of recently used tiles in memory
+    # (the same tiles are requested repeatedly while panning / zooming)
+    r = _get_session().get(url, headers={"User-Agent": user_agent})
+    r.raise_for_status()
+    return r.content
+
+
 class TileFactory(GoogleWTS):
     def __init__(self, url, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._url = url
 
+    def get_image(self, tile):
+        import requests
+
+        try:
+            content = _get_tile_content(self._image_url(tile), self.user_agent)
+            img = Image.open(BytesIO(content))
+        except requests.exceptions.RequestException as err:
+            print(err)
+            img = Image.fromarray(
+                np.full((256, 256, 3), (250, 250, 250), dtype=np.uint8)
+            )
+
+        img = img.convert(self.desired_tile_form)
+        return img, self.tileextent(tile), "lower"
+
     def _image_url(self, tile):
         x, y, z = tile
 
@@ -855,7 +985,10 @@ class xyzRasterSource(RasterSource):
     # function to estimate a proper zoom-level
     @staticmethod
     def _getz(d, zmax):
-        z = int(np.clip(np.ceil(np.log2(1 / d * 40075016.68557849)), 0, zmax))
+        # (use math instead of numpy since this is evaluated on scalars)
+        if d <= 0:
+            return zmax
+        z = min(max(math.ceil(math.log2(1 / d * 40075016.68557849)), 0), zmax)
         return z
 
     def getz(self, extent, target_resolution, zmax):
@@ -871,7 +1004,7 @@ class xyzRasterSource(RasterSource):
 
         # use the target resolution to increase the zoom-level until we use a
         # reasonable amount of tiles
-        nimgs = np.ceil(max(target_resolution) / 256) ** 2
+        nimgs = math.ceil(max(target_resolution) / 256) ** 2
 
         while ntiles < nimgs:
             if z >= self._maxzoom:
@@ -934,7 +1067,9 @@ class xyzRasterSource(RasterSource):
 
             # reproject the extent to the output-crs
 
-            target_extent = ogc_clients._target_extents(extent, self._crs, output_proj)
+            from cartopy.io.ogc_clients import _target_extents
+
+            target_extent = _target_extents(extent, self._crs, output_proj)
             if len(target_extent) > 0:
                 target_extent = target_extent[0]
             else:
@@ -975,6 +1110,8 @@ class xyzRasterSource(RasterSource):
         if projection == self._crs:
             wms_extents = [extent]
         else:
+            from cartopy.io.ogc_clients import _target_extents
+
             # Calculate the bounding box(es) in WMS projection.
             wms_extents = _target_extents(extent, projection, self._crs)
 
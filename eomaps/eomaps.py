@@ -418,6 +418,7 @@ class Maps(object):
         # remove the children from the parent Maps object
         if self in self.parent._children:
             self.parent._children.remove(self)
+            self.parent.cb._reset_axes_objs()
 
     from_file = from_file
     read_file = read_file
@@ -880,6 +881,8 @@ class Maps(object):
 
         self._gridspec = gs
 
+        # make sure events on the new axes are dispatched to the callbacks
+        self.parent.cb._reset_axes_objs()
         # initialize the callbacks
         self.cb._init_cbs()
 
@@ -983,6 +986,7 @@ class Maps(object):
 
     def _add_child(self, m):
         self.parent._children.add(m)
+        self.parent.cb._reset_axes_objs()
 
     @property
     def parent(self):
@@ -1,5 +1,6 @@
 """a collection of useful helper-functions."""
 from itertools import tee
+from functools import lru_cache
 import re
 import sys
 
@@ -11,6 +12,8 @@ from matplotlib.transforms import Bbox
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
 
+from pyproj import Transformer
+
 
 def pairwise(iterable, pairs=2):
     """
@@ -30,15 +33,25 @@ def pairwise(iterable, pairs=2):
     return zip(*x)
 
 
+@lru_cache(maxsize=128)
+def _get_transformer(in_crs, out_crs):
+    """get a (cached) transformer between two crs"""
+    return Transformer.from_crs(in_crs, out_crs, always_xy=True)
+
+
+_sanitize_leading = re.compile("^[^a-zA-Z_]+")
+_sanitize_invalid = re.compile("[^0-9a-zA-Z_]")
+
+
 def _sanitize(s, prefix="layer_"):
     # taken from https://stackoverflow.com/a/3303361/9703451
     s = str(s)
     # Remove leading characters until we find a letter or underscore
-    s2 = re.sub("^[^a-zA-Z_]+", "", s)
+    s2 = _sanitize_leading.sub("", s)
     if len(s2) == 0:
         s2 = _sanitize(prefix + str(s))
     # replace invalid characters with an underscore
-    s = re.sub("[^0-9a-zA-Z_]", "_", s2)
+    s = _sanitize_invalid.sub("_", s2)
     return s
 
 
@@ -19,6 +19,90 @@ class TestWMS(unittest.TestCase):
 
         self.data = pd.DataFrame(dict(x=x, y=y, value=y - x))
 
+    def test_layer_namespace(self):
+        # offline test of the lazy initialization of WebMap layers
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from eomaps._webmap import _WebServiec_collection, _wms_layer
+
+        service = SimpleNamespace(
+            contents={
+                "layer 1": SimpleNamespace(styles={}),
+                "Layer-2": SimpleNamespace(styles={"default": {}}),
+            }
+        )
+
+        m = Maps()
+        wms = _WebServiec_collection(m, service_type="wms", url="https://not.used")
+
+        with patch.object(
+            _WebServiec_collection, "_get_wms", return_value=service
+        ) as get_wms:
+            self.assertEqual(wms.layers, ["layer_1", "Layer_2"])
+            self.assertEqual(wms.findlayer("LAYER_2"), ["Layer_2"])
+            self.assertEqual(sorted(dir(wms.add_layer)), ["Layer_2", "layer_1"])
+
+            # layer-objects are only created on first access
+            self.assertNotIn("layer_1", wms.add_layer.__dict__)
+            layer = wms.add_layer.layer_1
+            self.assertIsInstance(layer, _wms_layer)
+            self.assertEqual(layer.name, "layer 1")
+            self.assertIs(layer.wms_layer, service.contents["layer 1"])
+            self.assertIn("layer_1", wms.add_layer.__dict__)
+            self.assertNotIn("Layer_2", wms.add_layer.__dict__)
+
+            # ... and cached afterwards
+            self.assertIs(wms.add_layer.layer_1, layer)
+            self.assertIs(wms["layer_1"], layer)
+            self.assertEqual(wms["Layer_2"]._style, "default")
+
+            with self.assertRaises(AttributeError):
+                wms.add_layer.asdf
+            with self.assertRaises(KeyError):
+                wms["asdf"]
+
+            # the capabilities are only fetched once
+            get_wms.assert_called_once_with("https://not.used")
+
+        plt.close(m.figure.f)
+
+    def test_REST_service_retry(self):
+        # offline test that failed fetches are retried on the next access
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from eomaps._webmap import _REST_WMSservice
+
+        service = SimpleNamespace(contents={"layer 1": SimpleNamespace(styles={})})
+
+        m = Maps()
+        rest_service = _REST_WMSservice(
+            m=m,
+            service="https://not.used/rest/services",
+            s_name="asdf",
+            s_type="MapServer",
+            service_type="wms",
+        )
+
+        with patch.object(
+            _REST_WMSservice, "_check_url", side_effect=[OSError("timeout"), True]
+        ) as check_url, patch.object(
+            _REST_WMSservice, "_get_wms", return_value=service
+        ):
+            with self.assertRaises(OSError):
+                rest_service.add_layer
+
+            self.assertIsNone(rest_service._layers)
+
+            layer = rest_service.add_layer.layer_layer_1
+            self.assertEqual(layer.name, "layer 1")
+            self.assertEqual(check_url.call_count, 2)
+
+            # successful fetches are cached
+            self.assertIs(rest_service.add_layer.layer_layer_1, layer)
+            self.assertEqual(check_url.call_count, 2)
+
+        plt.close(m.figure.f)
+
     def test_WMS_OSM(self):
         m = Maps(Maps.CRS.GOOGLE_MERCATOR)
         m.add_wms.OpenStreetMap.add_layer.default()
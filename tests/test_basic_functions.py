@@ -198,6 +198,8 @@ class TestBasicPlotting(unittest.TestCase):
             self.assertTrue(len(m.cb.pick.get.attached_callbacks) == 1)
             m.cb.pick.remove(cbID)
             self.assertTrue(len(m.cb.pick.get.attached_callbacks) == 0)
+            self.assertTrue(len(m.cb.pick.get.cbs) == 0)
+            self.assertTrue(len(m.cb.pick._cb_names) == 0)
 
         # attach all click callbacks
         for n, cb in enumerate(m.cb.click._cb_list):
@@ -225,6 +227,17 @@ class TestBasicPlotting(unittest.TestCase):
             self.assertTrue(len(m.cb.click.get.attached_callbacks) == 1)
             m.cb.click.remove(cbID)
             self.assertTrue(len(m.cb.click.get.attached_callbacks) == 0)
+            self.assertTrue(len(m.cb.click.get.cbs) == 0)
+            self.assertTrue(len(m.cb.click._cb_names) == 0)
+
+        # callbacks with the same name on single- and double-clicks
+        cid_single = m.cb.click.attach.get_values(double_click=False)
+        cid_double = m.cb.click.attach.get_values(double_click=True)
+        m.cb.click.remove(cid_single)
+        self.assertTrue(len(m.cb.click._cb_names) == 1)
+        self.assertTrue(m.cb.click.get.attached_callbacks == [cid_double])
+        m.cb.click.remove(cid_double)
+        self.assertTrue(len(m.cb.click._cb_names) == 0)
 
         # attach all keypress callbacks
         double_click, mouse_button = True, 1
@@ -242,6 +255,7 @@ class TestBasicPlotting(unittest.TestCase):
             self.assertTrue(len(m.cb.keypress.get.attached_callbacks) == 1)
             m.cb.keypress.remove(cbID)
             self.assertTrue(len(m.cb.keypress.get.attached_callbacks) == 0)
+            self.assertTrue(len(m.cb.keypress.get.cbs) == 0)
 
         plt.close(m.figure.f)
 
@@ -382,3 +382,87 @@ class TestCallbacks(unittest.TestCase):
         m.cb.keypress.remove(cid0)
         m.cb.keypress.remove(cid1)
         plt.close("all")
+
+    def test_share_events(self):
+        mg = MapsGrid(1, 3, crs=[4326, 3857, 4326])
+        mg.set_data(self.data, x="lon", y="lat")
+        mg.plot_map()
+        mg.f.canvas.draw()
+
+        m0, m1, m2 = mg.m_0_0, mg.m_0_1, mg.m_0_2
+
+        # ---------- test as CLICK callback
+        m0.cb.click.share_events(m1, m2)
+        m0.cb.click.attach.get_values()
+        m1.cb.click.attach.get_values()
+        m2.cb.click.attach.get_values()
+
+        self.click_ax_center(m0)
+        self.assertEqual(len(m0.cb.click.get.picked_vals["pos"]), 1)
+        self.assertEqual(len(m1.cb.click.get.picked_vals["pos"]), 1)
+        self.assertEqual(len(m2.cb.click.get.picked_vals["pos"]), 1)
+
+        # no transformation is required for maps with the same crs
+        self.assertEqual(
+            m0.cb.click.get.picked_vals["pos"][0], m2.cb.click.get.picked_vals["pos"][0]
+        )
+
+        # the forwarded position must be transformed to the crs of the map
+        x, y = m1._transf_lonlat_to_plot.transform(
+            *m0.cb.click.get.picked_vals["pos"][0]
+        )
+        np.testing.assert_allclose(m1.cb.click.get.picked_vals["pos"][0], (x, y))
+
+        # ---------- test as PICK callback
+        m0.cb.pick.share_events(m1)
+        m0.cb.pick.attach.get_values()
+        m1.cb.pick.attach.get_values()
+
+        self.click_ax_center(m1)
+        self.assertEqual(len(m0.cb.pick.get.picked_vals["ID"]), 1)
+        self.assertEqual(len(m1.cb.pick.get.picked_vals["ID"]), 1)
+        self.assertEqual(
+            m0.cb.pick.get.picked_vals["ID"][0], m1.cb.pick.get.picked_vals["ID"][0]
+        )
+
+        plt.close("all")
+
+    def test_threaded_callback(self):
+        import threading
+
+        m = self.create_basic_map()
+
+        called = threading.Event()
+        threads = []
+
+        def cb(**kwargs):
+            threads.append(threading.current_thread())
+            called.set()
+
+        cid = m.cb.click.attach(cb, threaded=True, on_motion=False)
+        self.click_ax_center(m)
+
+        self.assertTrue(called.wait(5))
+        self.assertIsNot(threads[0], threading.main_thread())
+
+        # the thread must exit if the callback is removed
+        m.cb.click.remove(cid)
+        threads[0].join(5)
+        self.assertFalse(threads[0].is_alive())
+
+        # the thread must exit if the figure is closed
+        called.clear()
+        m.cb.click.attach(cb, threaded=True, on_motion=False)
+        self.click_ax_center(m)
+
+        self.assertTrue(called.wait(5))
+        self.assertIsNot(threads[1], threads[0])
+
+        # (non-interactive backends don't trigger a close_event on plt.close)
+        from matplotlib.backend_bases import CloseEvent
+
+        canvas = m.figure.f.canvas
+        canvas.callbacks.process("close_event", CloseEvent("close_event", canvas))
+        plt.close("all")
+        threads[1].join(5)
+        self.assertFalse(threads[1].is_alive())